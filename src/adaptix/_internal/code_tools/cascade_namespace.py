@@ -48,10 +48,8 @@ class BuiltinCascadeNamespace(CascadeNamespace):
             or (name in NAME_TO_BUILTIN and not self._allow_builtins)
         ):
             return False
-        if name in self._constants:
-            return value is self._constants[name]
-        self._constants[name] = value
-        return True
+        # setdefault performs lookup and insertion with a single hashing
+        return self._constants.setdefault(name, value) is value
 
     def try_add_outer_constant(self, name: str, value: object) -> bool:
         if (
@@ -59,10 +57,7 @@ class BuiltinCascadeNamespace(CascadeNamespace):
             or (name in NAME_TO_BUILTIN and not self._allow_builtins)
         ):
             return False
-        if name in self._outer_constants:
-            return value is self._outer_constants[name]
-        self._outer_constants[name] = value
-        return True
+        return self._outer_constants.setdefault(name, value) is value
 
     def try_register_var(self, name: str) -> bool:
         if (
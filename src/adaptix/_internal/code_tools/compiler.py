@@ -1,7 +1,9 @@
 import linecache
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from functools import lru_cache
+from itertools import count
 from threading import Lock
+from types import CodeType
 from typing import Any, Callable
 
 from .code_builder import CodeBuilder
@@ -28,22 +30,39 @@ class ClosureCompiler(ABC):
 
 
 class ConcurrentCounter:
-    __slots__ = ("_lock", "_name_to_idx")
+    __slots__ = ("_lock", "_name_to_counter")
 
     def __init__(self) -> None:
         self._lock = Lock()
-        self._name_to_idx: dict[str, int] = defaultdict(lambda: 0)
+        self._name_to_counter: dict[str, count] = {}
 
     def generate_idx(self, name: str) -> int:
-        with self._lock:
-            idx = self._name_to_idx[name]
-            self._name_to_idx[name] += 1
-            return idx
+        # lock is acquired only to create a new counter, `next()` of `itertools.count` is atomic
+        counter = self._name_to_counter.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._name_to_counter.setdefault(name, count())
+        return next(counter)
 
 
 _counter = ConcurrentCounter()
 
 
+@lru_cache(maxsize=512)
+def _compile_source(source: str) -> CodeType:
+    return compile(source, "<adaptix generated>", "exec")
+
+
+def _replace_filename(code_obj: CodeType, filename: str) -> CodeType:
+    return code_obj.replace(
+        co_filename=filename,
+        co_consts=tuple(
+            _replace_filename(const, filename) if isinstance(const, CodeType) else const
+            for const in code_obj.co_consts
+        ),
+    )
+
+
 class BasicClosureCompiler(ClosureCompiler):
     def _make_source_builder(self, builder: CodeBuilder) -> CodeBuilder:
         main_builder = CodeBuilder()
@@ -55,7 +74,9 @@ class BasicClosureCompiler(ClosureCompiler):
         return main_builder
 
     def _compile(self, source: str, unique_filename: str, namespace: dict[str, Any]):
-        code_obj = compile(source, unique_filename, "exec")
+        # generated sources often coincide, so compilation result is reused,
+        # only filename is substituted to make tracebacks point to the right place
+        code_obj = _replace_filename(_compile_source(source), unique_filename)
 
         local_namespace: dict[str, Any] = {}
         exec(code_obj, namespace, local_namespace)  # noqa: S102
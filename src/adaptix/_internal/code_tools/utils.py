@@ -105,6 +105,20 @@ def get_literal_from_factory(obj: object) -> Optional[str]:
         return None
 
 
+# builtin types called without arguments always produce equal values,
+# so such factory can be called once if the result is only compared
+_CONSTANT_FACTORIES = frozenset(
+    {list, dict, tuple, set, frozenset, str, bytes, bytearray, int, float, complex, bool, type(None)},
+)
+
+
+def is_constant_factory(obj: object) -> bool:
+    try:
+        return obj in _CONSTANT_FACTORIES
+    except TypeError:
+        return False
+
+
 _SINGLETONS = {None, Ellipsis, NotImplemented}
 
 
@@ -32,7 +32,7 @@ class NativePydanticProvider(LoaderProvider, DumperProvider):
         self._serialization_params = serialization_params
 
     def _skip_omitted(self, mapping: Mapping[str, T]) -> Mapping[str, T]:
-        return {k: v for k, v in mapping.items() if v != Omitted()}
+        return {k: v for k, v in mapping.items() if v is not Omitted()}
 
     def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
         validation_params = self._skip_omitted(self._validation_params)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import Counter
 from collections.abc import Hashable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
@@ -7,7 +8,7 @@ from typing import Any, Callable, Generic, Optional, TypeVar, Union
 from ..common import Catchable, TypeHint, VarTuple
 from ..feature_requirement import DistributionRequirement, DistributionVersionRequirement
 from ..struct_trail import Attr, TrailElement
-from ..utils import SingletonMeta, pairs
+from ..utils import SingletonMeta
 
 S = TypeVar("S")
 T = TypeVar("T")
@@ -20,12 +21,17 @@ class NoDefault(metaclass=SingletonMeta):
 @dataclass(frozen=True)
 class DefaultValue(Generic[T]):
     value: T
+    _hash: int = field(init=False, repr=False, compare=False)
 
-    def __hash__(self):
+    def __post_init__(self):
         try:
-            return hash(self.value)
+            value_hash = hash(self.value)
         except TypeError:
-            return 236  # some random number that fits in byte
+            value_hash = 236  # some random number that fits in byte
+        super().__setattr__("_hash", value_hash)
+
+    def __hash__(self):
+        return self._hash
 
 
 @dataclass(frozen=True)
@@ -42,6 +48,8 @@ Default = Union[NoDefault, DefaultValue[Any], DefaultFactory[Any], DefaultFactor
 
 
 class Accessor(Hashable, ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def getter(self) -> Callable[[Any], Any]:
@@ -59,6 +67,8 @@ class Accessor(Hashable, ABC):
 
 
 class DescriptorAccessor(Accessor, ABC):
+    __slots__ = ("_access_error", "_attr_name")
+
     def __init__(self, attr_name: str, access_error: Optional[Catchable]):
         self._attr_name = attr_name
         self._access_error = access_error
@@ -92,6 +102,8 @@ class DescriptorAccessor(Accessor, ABC):
 
 
 class ItemAccessor(Accessor):
+    __slots__ = ("_access_error", "_path_element", "key")
+
     def __init__(self, key: Union[int, str], access_error: Optional[Catchable], path_element: TrailElement):
         self.key = key
         self._access_error = access_error
@@ -169,23 +181,25 @@ class BaseField:
 @dataclass(frozen=True)
 class InputField(BaseField):
     is_required: bool
+    # derived attributes are computed once because they are accessed many times during code generation
+    is_optional: bool = field(init=False, hash=False, repr=False, compare=False)
 
-    @property
-    def is_optional(self):
-        return not self.is_required
+    def __post_init__(self):
+        super().__post_init__()
+        super().__setattr__("is_optional", not self.is_required)
 
 
 @dataclass(frozen=True)
 class OutputField(BaseField):
     accessor: Accessor
+    is_required: bool = field(init=False, hash=False, repr=False, compare=False)
+    is_optional: bool = field(init=False, hash=False, repr=False, compare=False)
 
-    @property
-    def is_optional(self) -> bool:
-        return not self.is_required
-
-    @property
-    def is_required(self) -> bool:
-        return self.accessor.access_error is None
+    def __post_init__(self):
+        super().__post_init__()
+        is_required = self.accessor.access_error is None
+        super().__setattr__("is_required", is_required)
+        super().__setattr__("is_optional", not is_required)
 
 
 @dataclass(frozen=True)
@@ -198,15 +212,15 @@ class BaseShape:
     fields_dict: Mapping[str, BaseField] = field(init=False, hash=False, repr=False, compare=False)
 
     def _validate(self):
-        field_ids = {fld.id for fld in self.fields}
-        if len(field_ids) != len(self.fields):
+        # fields_dict is already built, so it is reused to find duplicates and missing fields
+        if len(self.fields_dict) != len(self.fields):
             duplicates = {
-                fld.id for fld in self.fields
-                if fld.id in field_ids
+                field_id for field_id, count in Counter(fld.id for fld in self.fields).items()
+                if count > 1
             }
             raise ValueError(f"Field ids {duplicates} are duplicated")
 
-        wild_overriden_types = self.overriden_types - field_ids
+        wild_overriden_types = self.overriden_types.difference(self.fields_dict)
         if wild_overriden_types:
             raise ValueError(f"overriden_types contains non existing fields {wild_overriden_types}")
 
@@ -233,7 +247,8 @@ class Param:
     def _validate(self) -> None:
         if not self.name.isidentifier():
             raise ValueError(f"Parameter name must be python identifier, now it is a {self.name!r}")
-        if not is_valid_field_id(self.field_id):
+        # name is usually equal to field id, so field id was already checked above
+        if self.field_id != self.name and not is_valid_field_id(self.field_id):
             raise ValueError(f"Field id must be python identifier, now it is a {self.field_id!r}")
 
     def __post_init__(self):
@@ -262,44 +277,65 @@ class InputShape(BaseShape, Generic[T]):
     def allow_kwargs(self) -> bool:
         return self.kwargs is not None
 
-    def _validate(self):
+    def _validate(self) -> None:
         super()._validate()
 
-        param_names = {param.name for param in self.params}
+        # all params are examined in a single pass, errors are raised in order of their importance
+        param_names: set[str] = set()
+        wild_params: dict[str, str] = {}
+        bound_field_ids: set[str] = set()
+        order_error: Optional[str] = None
+        pos_only_error: Optional[str] = None
+        past: Optional[Param] = None
+        past_field: Optional[InputField] = None
+        for param in self.params:
+            param_names.add(param.name)
+            bound_field_ids.add(param.field_id)
+
+            current_field = self.fields_dict.get(param.field_id)
+            if current_field is None:
+                wild_params[param.name] = param.field_id
+            else:
+                if order_error is None and past is not None and past_field is not None:
+                    order_error = self._get_params_order_error(past, past_field, param, current_field)
+                if (
+                    pos_only_error is None
+                    and param.kind == ParamKind.POS_ONLY
+                    and current_field.is_optional
+                ):
+                    pos_only_error = f"Field {param.field_id!r} can not be positional only and optional"
+            past = param
+            past_field = current_field
+
         if len(param_names) != len(self.params):
             duplicates = {
-                param.name for param in self.params
-                if param.name in param_names
+                name for name, count in Counter(param.name for param in self.params).items()
+                if count > 1
             }
             raise ValueError(f"Parameter names {duplicates} are duplicated")
-
-        wild_params = {param.name: param.field_id for param in self.params if param.field_id not in self.fields_dict}
         if wild_params:
             raise ValueError(f"Parameters {wild_params} bind to non-existing fields")
 
-        wild_fields = self.fields_dict.keys() - {param.field_id for param in self.params}
+        wild_fields = self.fields_dict.keys() - bound_field_ids
         if wild_fields:
             raise ValueError(f"Fields {wild_fields} do not bound to any parameter")
-
-        for past, current in pairs(self.params):
-            if past.kind.value > current.kind.value:
-                raise ValueError(
-                    f"Inconsistent order of fields, {current.kind} must be after {past.kind}",
-                )
-
-            if (
-                self.fields_dict[past.field_id].is_optional
-                and self.fields_dict[current.field_id].is_required
-                and current.kind != ParamKind.KW_ONLY
-            ):
-                raise ValueError(
-                    f"All not required fields must be after required ones"
-                    f" except {ParamKind.KW_ONLY} fields",
-                )
-
-        for param in self.params:
-            if param.kind == ParamKind.POS_ONLY and self.fields_dict[param.field_id].is_optional:
-                raise ValueError(f"Field {param.field_id!r} can not be positional only and optional")
+        if order_error is not None:
+            raise ValueError(order_error)
+        if pos_only_error is not None:
+            raise ValueError(pos_only_error)
+
+    def _get_params_order_error(
+        self,
+        past: Param,
+        past_field: InputField,
+        current: Param,
+        current_field: InputField,
+    ) -> Optional[str]:
+        if past.kind.value > current.kind.value:
+            return f"Inconsistent order of fields, {current.kind} must be after {past.kind}"
+        if past_field.is_optional and current_field.is_required and current.kind != ParamKind.KW_ONLY:
+            return f"All not required fields must be after required ones except {ParamKind.KW_ONLY} fields"
+        return None
 
 
 @dataclass(frozen=True)
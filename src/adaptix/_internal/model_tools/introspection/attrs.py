@@ -67,7 +67,7 @@ def _get_input_shape(tp, attrs_fields, type_hints) -> InputShape:
             default=_get_default(attrs_fld),
             metadata=attrs_fld.metadata,
             original=attrs_fld,
-            is_required=_get_default(attrs_fld) == NoDefault(),
+            is_required=_get_default(attrs_fld) is NoDefault(),
         )
         for attrs_fld in attrs_fields
         if attrs_fld.init
@@ -43,7 +43,7 @@ def _create_inp_field_from_dc_field(dc_field: DCField, type_hints):
         type=type_hints[dc_field.name],
         id=dc_field.name,
         default=default,
-        is_required=default == NoDefault(),
+        is_required=default is NoDefault(),
         metadata=dc_field.metadata,
         original=dc_field,
     )
@@ -117,7 +117,7 @@ def _get_input_shape(tp: "type[BaseModel]") -> InputShape:
                 default=_get_default(field_info),
                 metadata={},  # pydantic metadata is the list
                 original=field_info,
-                is_required=_get_default(field_info) == NoDefault(),
+                is_required=_get_default(field_info) is NoDefault(),
             )
             for field_id, field_info in tp.model_fields.items()
         ),
@@ -11,6 +11,7 @@ from ..morphing.provider_template import DumperProvider, LoaderProvider
 from ..provider.essential import Mediator
 from ..provider.located_request import LocatedRequest, for_predicate
 from ..provider.location import GenericParamLoc
+from ..special_cases_optimization import as_is_stub
 from ..struct_trail import ItemKey, append_trail, render_trail_as_note
 from ..type_tools import BaseNormType
 from .load_error import AggregateLoadError, LoadError, TypeLoadError
@@ -169,6 +170,9 @@ class DictProvider(LoaderProvider, DumperProvider):
         )
 
     def _make_dumper(self, key_dumper: Dumper, value_dumper: Dumper, debug_trail: DebugTrail):
+        if key_dumper == as_is_stub and value_dumper == as_is_stub:
+            # stub never raises an error, so there is no trail to collect
+            return self._get_dumper_as_is()
         if debug_trail == DebugTrail.DISABLE:
             return self._get_dumper_dt_disable(
                 key_dumper=key_dumper,
@@ -186,6 +190,12 @@ class DictProvider(LoaderProvider, DumperProvider):
             )
         raise ValueError
 
+    def _get_dumper_as_is(self):
+        def dict_dumper_as_is(data: Mapping):
+            return dict(data.items())
+
+        return dict_dumper_as_is
+
     def _get_dumper_dt_disable(self, key_dumper, value_dumper):
         def dict_dumper_dt_disable(data: Mapping):
             result = {}
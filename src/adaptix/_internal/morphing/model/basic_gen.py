@@ -121,7 +121,11 @@ def _collect_used_direct_fields(crown: BaseCrown) -> set[str]:
 
 def get_skipped_fields(shape: BaseShape, name_layout: BaseNameLayout) -> Set[str]:
     used_direct_fields = _collect_used_direct_fields(name_layout.crown)
-    extra_targets = name_layout.extra_move.fields if isinstance(name_layout.extra_move, ExtraTargets) else ()
+    extra_targets: Container[str] = (
+        frozenset(name_layout.extra_move.fields)
+        if isinstance(name_layout.extra_move, ExtraTargets) else
+        ()
+    )
     return {
         field.id for field in shape.fields
         if field.id not in used_direct_fields and field.id not in extra_targets
@@ -230,7 +234,7 @@ def compile_closure_with_globals_capturing(
 
 def has_collect_policy(crown: InpCrown) -> bool:
     if isinstance(crown, InpDictCrown):
-        return crown.extra_policy == ExtraCollect() or any(
+        return crown.extra_policy is ExtraCollect() or any(
             has_collect_policy(sub_crown)
             for sub_crown in crown.map.values()
         )
@@ -6,7 +6,7 @@ from typing import Any, Callable, NamedTuple
 
 from ...code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNamespace
 from ...code_tools.code_builder import CodeBuilder
-from ...code_tools.utils import get_literal_expr, get_literal_from_factory, is_singleton
+from ...code_tools.utils import get_literal_expr, get_literal_from_factory, is_constant_factory, is_singleton
 from ...common import Dumper
 from ...compat import CompatExceptionGroup
 from ...definitions import DebugTrail
@@ -117,7 +117,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
             if isinstance(self._name_layout.extra_move, ExtraTargets)
             else ()
         )
-        self._id_to_field: dict[str, OutputField] = {field.id: field for field in self._shape.fields}
+        self._id_to_field: Mapping[str, OutputField] = self._shape.fields_dict
         self._model_identity = model_identity
 
     def produce_code(self, closure_name: str) -> tuple[str, Mapping[str, object]]:
@@ -625,12 +625,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
             return f"{input_expr} != {v_default}"
 
         if isinstance(default_clause, DefaultFactory):
-            literal_expr = get_literal_from_factory(default_clause.factory)
-            if literal_expr is not None:
-                return f"{input_expr} != {literal_expr}"
-            v_default = state.v_default(key)
-            state.namespace.add_constant(v_default, default_clause.factory)
-            return f"{input_expr} != {v_default}()"
+            return self._get_default_factory_condition(state, default_clause, key, input_expr)
 
         if isinstance(default_clause, DefaultFactoryWithSelf):
             v_default = state.v_default(key)
@@ -639,6 +634,24 @@ class BuiltinModelDumperGen(ModelDumperGen):
 
         raise TypeError
 
+    def _get_default_factory_condition(
+        self,
+        state: GenState,
+        default_clause: DefaultFactory,
+        key: str,
+        input_expr: str,
+    ) -> str:
+        literal_expr = get_literal_from_factory(default_clause.factory)
+        if literal_expr is not None:
+            return f"{input_expr} != {literal_expr}"
+
+        v_default = state.v_default(key)
+        if is_constant_factory(default_clause.factory):
+            state.namespace.add_constant(v_default, default_clause.factory())
+            return f"{input_expr} != {v_default}"
+        state.namespace.add_constant(v_default, default_clause.factory)
+        return f"{input_expr} != {v_default}()"
+
     def _gen_list_crown(self, state: GenState, crown: OutListCrown):
         for i, sub_crown in enumerate(crown.map):
             self._gen_crown_dispatch(state, sub_crown, i)
@@ -702,7 +715,7 @@ class ModelOutputJSONSchemaGen:
         field = self._shape.fields_dict[crown.id]
         json_schema = self._field_json_schema_getter(field)
         default = self._field_default_dumper(field)
-        if default != Omitted():
+        if default is not Omitted():
             return replace(json_schema, default=default)
         return json_schema
 
@@ -339,7 +339,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             if self._has_packed_fields:
                 constructor_builder("**packed_fields,")
 
-            if self._name_layout.extra_move == ExtraKwargs():
+            if self._name_layout.extra_move is ExtraKwargs():
                 constructor_builder(f"**{state.v_extra},")
 
         constructor_builder += ")"
@@ -524,14 +524,14 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
                     state.builder.empty_line()
                     state.type_checked_type_paths.add(state.path)
 
-                if crown.extra_policy == ExtraForbid():
+                if crown.extra_policy is ExtraForbid():
                     state.builder += f"""
                         {state.v_extra}_set = set({state.v_data}) - {state.v_known_keys}
                         if {state.v_extra}_set:
                             {state.emit_error(f"ExtraFieldsLoadError({state.v_extra}_set, {state.v_data})")}
                     """
                     state.builder.empty_line()
-                elif crown.extra_policy == ExtraCollect():
+                elif crown.extra_policy is ExtraCollect():
                     state.builder += f"""
                         for key in set({state.v_data}) - {state.v_known_keys}:
                             {state.v_extra}[key] = {state.v_data}[key]
@@ -575,7 +575,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
                     state.type_checked_type_paths.add(state.path)
 
                 expected_len = len(crown.map)
-                if crown.extra_policy == ExtraForbid():
+                if crown.extra_policy is ExtraForbid():
                     state.builder += f"""
                         if len({state.v_data}) != {expected_len}:
                             if len({state.v_data}) < {expected_len}:
@@ -766,7 +766,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         if not isinstance(extra_move, ExtraTargets):
             return
 
-        if self._name_layout.crown.extra_policy == ExtraCollect():
+        if self._name_layout.crown.extra_policy is ExtraCollect():
             for target in extra_move.fields:
                 field = self._id_to_field[target]
 
@@ -816,7 +816,7 @@ class ModelInputJSONSchemaGen:
                 key: self.convert_crown(value)
                 for key, value in crown.map.items()
             },
-            additional_properties=crown.extra_policy != ExtraForbid(),
+            additional_properties=crown.extra_policy is not ExtraForbid(),
         )
 
     def _convert_list_crown(self, crown: InpListCrown) -> JSONSchema:
@@ -827,7 +827,7 @@ class ModelInputJSONSchemaGen:
         return JSONSchema(
             type=JSONSchemaType.ARRAY,
             prefix_items=items,
-            max_items=len(items) if crown.extra_policy != ExtraForbid() else Omitted(),
+            max_items=len(items) if crown.extra_policy is not ExtraForbid() else Omitted(),
             min_items=len(items),
         )
 
@@ -835,7 +835,7 @@ class ModelInputJSONSchemaGen:
         field = self._shape.fields_dict[crown.id]
         json_schema = self._field_json_schema_getter(field)
         default = self._field_default_dumper(field)
-        if default != Omitted():
+        if default is not Omitted():
             return replace(json_schema, default=default)
         return json_schema
 
@@ -1,12 +1,12 @@
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Container, Iterable, Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Optional, TypeVar, Union
 
 from ...common import VarTuple
 from ...model_tools.definitions import (
     BaseField,
-    BaseShape,
     DefaultFactory,
     DefaultFactoryWithSelf,
     DefaultValue,
@@ -17,12 +17,12 @@ from ...model_tools.definitions import (
 from ...name_style import NameStyle, convert_snake_style
 from ...provider.essential import CannotProvide, Mediator, Provider
 from ...provider.fields import field_to_loc
-from ...provider.loc_stack_filtering import LocStackChecker
+from ...provider.loc_stack_filtering import LocStack, LocStackChecker
 from ...provider.located_request import LocatedRequest
 from ...provider.overlay_schema import Overlay, Schema, provide_schema
 from ...retort.operating_retort import OperatingRetort
 from ...special_cases_optimization import with_default_clause
-from ...utils import Omittable, get_prefix_groups
+from ...utils import AlwaysEqualHashWrapper, Omittable, get_prefix_groups
 from ..model.crown_definitions import (
     BaseFieldCrown,
     BaseNameLayoutRequest,
@@ -93,6 +93,23 @@ F = TypeVar("F", bound=BaseField)
 FieldAndPath = tuple[F, Optional[KeyPath]]
 
 
+Sc = TypeVar("Sc", bound=Schema)
+
+
+def _provide_schema_via_wrapper(
+    overlay: type[Overlay[Sc]],
+    mediator: AlwaysEqualHashWrapper[Mediator],
+    loc_stack: LocStack,
+) -> Sc:
+    return provide_schema(overlay, mediator.value, loc_stack)
+
+
+def _provide_cached_schema(overlay: type[Overlay[Sc]], mediator: Mediator, loc_stack: LocStack) -> Sc:
+    # schema depends only on the retort recipe and the loc stack,
+    # but it is requested by several makers while the same model is processed
+    return mediator.cached_call(_provide_schema_via_wrapper, overlay, AlwaysEqualHashWrapper(mediator), loc_stack)
+
+
 def apply_lsc(
     mediator: Mediator,
     request: BaseNameLayoutRequest,
@@ -108,10 +125,18 @@ class NameMappingRetort(OperatingRetort):
         return self._provide_from_recipe(request)
 
 
+# crowns are immutable, so one instance can fill all gaps
+_INP_GAP_CROWN = InpNoneCrown()
+_OUT_GAP_CROWN = OutNoneCrown(placeholder=DefaultValue(None))
+# and field crowns are interned by field id, that are repeated across models
+_get_inp_field_crown = lru_cache(maxsize=4096)(InpFieldCrown)
+_get_out_field_crown = lru_cache(maxsize=4096)(OutFieldCrown)
+
+
 class BuiltinStructureMaker(StructureMaker):
-    def _generate_key(self, schema: StructureSchema, shape: BaseShape, field: BaseField) -> Key:
+    def _generate_key(self, schema: StructureSchema, field_idx: int, field: BaseField) -> Key:
         if schema.as_list:
-            return shape.fields.index(field)
+            return field_idx
 
         name = field.id
         if schema.trim_trailing_underscore and name.endswith("_") and not name.endswith("__"):
@@ -120,8 +145,16 @@ class BuiltinStructureMaker(StructureMaker):
             name = convert_snake_style(name, schema.name_style)
         return name
 
-    def _create_name_mapping_retort(self, schema: StructureSchema) -> NameMappingRetort:
-        return NameMappingRetort(recipe=schema.map)
+    def _create_name_mapping_retort(self, recipe: VarTuple[Provider]) -> NameMappingRetort:
+        return NameMappingRetort(recipe=recipe)
+
+    def _get_name_mapping_retort(self, mediator: Mediator, schema: StructureSchema) -> NameMappingRetort:
+        # retort is shared between all models of the outer retort that have the same name mapping
+        try:
+            hash(schema.map)
+        except TypeError:
+            return self._create_name_mapping_retort(schema.map)
+        return mediator.cached_call(self._create_name_mapping_retort, schema.map)
 
     def _map_fields(
         self,
@@ -130,20 +163,24 @@ class BuiltinStructureMaker(StructureMaker):
         schema: StructureSchema,
         extra_move: Union[InpExtraMove, OutExtraMove],
     ) -> Iterable[FieldAndPath]:
-        extra_targets = extra_move.fields if isinstance(extra_move, ExtraTargets) else ()
-        retort = self._create_name_mapping_retort(schema)
-        for field in request.shape.fields:
+        extra_targets: Container[str] = frozenset(extra_move.fields) if isinstance(extra_move, ExtraTargets) else ()
+        retort = self._get_name_mapping_retort(mediator, schema)
+        # skip and only are combined once, so the cheaper checker is evaluated first
+        field_filter = ~schema.skip & schema.only
+        for field_idx, field in enumerate(request.shape.fields):
             if field.id in extra_targets:
                 continue
 
-            generated_key = self._generate_key(schema, request.shape, field)
+            generated_key = self._generate_key(schema, field_idx, field)
+            # the same loc stack is used for name mapping and for field filtering
+            loc_stack = request.loc_stack.append_with(field_to_loc(field))
             try:
                 path = retort.provide_name_mapping(
                     NameMappingRequest(
                         shape=request.shape,
                         field=field,
                         generated_key=generated_key,
-                        loc_stack=request.loc_stack.append_with(field_to_loc(field)),
+                        loc_stack=loc_stack,
                     ),
                 )
             except CannotProvide:
@@ -151,46 +188,59 @@ class BuiltinStructureMaker(StructureMaker):
 
             if path is None:
                 yield field, None
-            elif (
-                not apply_lsc(mediator, request, schema.skip, field)
-                and apply_lsc(mediator, request, schema.only, field)
-            ):
+            elif field_filter.check_loc_stack(mediator, loc_stack):
                 yield field, path
             else:
                 yield field, None
 
+    def _get_duplicated_paths(self, fields_to_paths: Iterable[FieldAndPath]) -> Mapping[KeyPath, Sequence[str]]:
+        paths_to_field_ids: defaultdict[KeyPath, list[str]] = defaultdict(list)
+        for field, path in fields_to_paths:
+            if path is not None:
+                paths_to_field_ids[path].append(field.id)
+
+        return {
+            path: field_ids
+            for path, field_ids in paths_to_field_ids.items()
+            if len(field_ids) > 1
+        }
+
     def _validate_structure(
         self,
         request: LocatedRequest,
-        fields_to_paths: Iterable[FieldAndPath],
+        fields_to_paths: Sequence[FieldAndPath],
     ) -> None:
-        paths_to_fields: defaultdict[KeyPath, list[AnyField]] = defaultdict(list)
+        # all checks are based on a single pass, errors are raised in order of their importance
+        path_to_field: dict[KeyPath, AnyField] = {}
+        has_duplicates = False
+        optional_fields_at_list: list[str] = []
         for field, path in fields_to_paths:
             if path is not None:
-                paths_to_fields[path].append(field)
-
-        duplicates = {
-            path: [field.id for field in fields]
-            for path, fields in paths_to_fields.items()
-            if len(fields) > 1
-        }
-        if duplicates:
+                if path in path_to_field:
+                    has_duplicates = True
+                else:
+                    path_to_field[path] = field
+                if field.is_optional and isinstance(path[-1], int):
+                    optional_fields_at_list.append(field.id)
+
+        if has_duplicates:
             raise CannotProvide(
-                f"Paths {duplicates} pointed to several fields",
+                f"Paths {self._get_duplicated_paths(fields_to_paths)} pointed to several fields",
                 is_terminal=True,
                 is_demonstrative=True,
             )
 
-        prefix_groups = get_prefix_groups([path for field, path in fields_to_paths if path is not None])
+        # there are no duplicates, so keys are exactly the paths of all mapped fields
+        prefix_groups = get_prefix_groups(path_to_field.keys())
         if prefix_groups:
             details = ". ".join(
                 "Path {prefix} (field {prefix_field!r}) is prefix of {paths}".format(
                     prefix=list(prefix),
-                    prefix_field=paths_to_fields[prefix][0].id,
+                    prefix_field=path_to_field[prefix].id,
                     paths=", ".join(
                         "{path} (field {path_field!r})".format(  # noqa: UP032
                             path=list(path),
-                            path_field=paths_to_fields[path][0].id,
+                            path_field=path_to_field[path].id,
                         )
                         for path in paths
                     ),
@@ -203,11 +253,6 @@ class BuiltinStructureMaker(StructureMaker):
                 is_demonstrative=True,
             )
 
-        optional_fields_at_list = [
-            field.id
-            for field, path in fields_to_paths
-            if path is not None and field.is_optional and isinstance(path[-1], int)
-        ]
         if optional_fields_at_list:
             raise CannotProvide(
                 f"Optional fields {optional_fields_at_list} can not be mapped to list elements",
@@ -215,21 +260,29 @@ class BuiltinStructureMaker(StructureMaker):
                 is_demonstrative=True,
             )
 
-    def _iterate_sub_paths(self, paths: Iterable[KeyPath]) -> Iterable[tuple[KeyPath, Key]]:
+    def _iterate_sub_paths(self, paths: Iterable[KeyPath]) -> Sequence[tuple[KeyPath, Key]]:
+        # sub paths are walked from the longest one,
+        # so the walk stops at the first sub path shared with an already processed path
         yielded: set[tuple[KeyPath, Key]] = set()
+        add_yielded = yielded.add
+        sub_paths: list[tuple[KeyPath, Key]] = []
+        append_sub_path = sub_paths.append
         for path in paths:
             for i in range(len(path) - 1, -1, -1):
                 result = path[:i], path[i]
                 if result in yielded:
                     break
 
-                yielded.add(result)
-                yield result
+                add_yielded(result)
+                append_sub_path(result)
+        return sub_paths
 
     def _get_paths_to_list(self, request: LocatedRequest, paths: Iterable[KeyPath]) -> Mapping[KeyPath, set[int]]:
         paths_to_lists: defaultdict[KeyPath, set[int]] = defaultdict(set)
         paths_to_dicts: set[KeyPath] = set()
         for sub_path, key in self._iterate_sub_paths(paths):
+            # keys come from user mapping and can be int subclasses (IntEnum members),
+            # so exact type check can not be used here and at the crown builder
             if isinstance(key, int):
                 if sub_path in paths_to_dicts:
                     raise CannotProvide(
@@ -266,7 +319,12 @@ class BuiltinStructureMaker(StructureMaker):
 
         paths_to_lists = self._get_paths_to_list(request, paths_to_leaves.keys())
         for path, indexes in paths_to_lists.items():
-            for i in range(max(indexes)):
+            max_index = max(indexes)
+            # distinct indexes without gaps cover the whole range, so the scan can be skipped
+            if len(indexes) == max_index + 1 and min(indexes) >= 0:
+                continue
+
+            for i in range(max_index):
                 if i not in indexes:
                     complete_path = (*path, i)
                     paths_to_leaves[complete_path] = gaps_filler(complete_path)
@@ -274,10 +332,10 @@ class BuiltinStructureMaker(StructureMaker):
         return paths_to_leaves
 
     def _fill_input_gap(self, path: KeyPath) -> LeafInpCrown:
-        return InpNoneCrown()
+        return _INP_GAP_CROWN
 
     def _fill_output_gap(self, path: KeyPath) -> LeafOutCrown:
-        return OutNoneCrown(placeholder=DefaultValue(None))
+        return _OUT_GAP_CROWN
 
     def make_inp_structure(
         self,
@@ -285,7 +343,7 @@ class BuiltinStructureMaker(StructureMaker):
         request: InputNameLayoutRequest,
         extra_move: InpExtraMove,
     ) -> PathsTo[LeafInpCrown]:
-        schema = provide_schema(StructureOverlay, mediator, request.loc_stack)
+        schema = _provide_cached_schema(StructureOverlay, mediator, request.loc_stack)
         fields_to_paths: list[FieldAndPath[InputField]] = list(
             self._map_fields(mediator, request, schema, extra_move),
         )
@@ -300,7 +358,12 @@ class BuiltinStructureMaker(StructureMaker):
                 is_terminal=True,
                 is_demonstrative=True,
             )
-        paths_to_leaves = self._make_paths_to_leaves(request, fields_to_paths, InpFieldCrown, self._fill_input_gap)
+        paths_to_leaves = self._make_paths_to_leaves(
+            request,
+            fields_to_paths,
+            _get_inp_field_crown,
+            self._fill_input_gap,
+        )
         self._validate_structure(request, fields_to_paths)
         return paths_to_leaves
 
@@ -310,19 +373,24 @@ class BuiltinStructureMaker(StructureMaker):
         request: OutputNameLayoutRequest,
         extra_move: OutExtraMove,
     ) -> PathsTo[LeafOutCrown]:
-        schema = provide_schema(StructureOverlay, mediator, request.loc_stack)
+        schema = _provide_cached_schema(StructureOverlay, mediator, request.loc_stack)
         fields_to_paths: list[FieldAndPath[OutputField]] = list(
             self._map_fields(mediator, request, schema, extra_move),
         )
-        paths_to_leaves = self._make_paths_to_leaves(request, fields_to_paths, OutFieldCrown, self._fill_output_gap)
+        paths_to_leaves = self._make_paths_to_leaves(
+            request,
+            fields_to_paths,
+            _get_out_field_crown,
+            self._fill_output_gap,
+        )
         self._validate_structure(request, fields_to_paths)
         return paths_to_leaves
 
     def empty_as_list_inp(self, mediator: Mediator, request: InputNameLayoutRequest) -> bool:
-        return provide_schema(StructureOverlay, mediator, request.loc_stack).as_list
+        return _provide_cached_schema(StructureOverlay, mediator, request.loc_stack).as_list
 
     def empty_as_list_out(self, mediator: Mediator, request: OutputNameLayoutRequest) -> bool:
-        return provide_schema(StructureOverlay, mediator, request.loc_stack).as_list
+        return _provide_cached_schema(StructureOverlay, mediator, request.loc_stack).as_list
 
 
 @dataclass(frozen=True)
@@ -357,24 +425,30 @@ class BuiltinSievesMaker(SievesMaker):
         request: OutputNameLayoutRequest,
         paths_to_leaves: PathsTo[LeafOutCrown],
     ) -> PathsTo[Sieve]:
-        schema = provide_schema(SievesOverlay, mediator, request.loc_stack)
+        schema = _provide_cached_schema(SievesOverlay, mediator, request.loc_stack)
+        fields_dict = request.shape.fields_dict
+        omit_default = schema.omit_default
+        no_default = NoDefault()
         result = {}
         for path, leaf in paths_to_leaves.items():
             if isinstance(leaf, OutFieldCrown):
-                field = request.shape.fields_dict[leaf.id]
-                if field.default != NoDefault() and apply_lsc(mediator, request, schema.omit_default, field):
+                field = fields_dict[leaf.id]
+                if field.default is not no_default and apply_lsc(mediator, request, omit_default, field):
                     result[path] = self._create_sieve(field)
         return result
 
 
 def _paths_to_branches(paths_to_leaves: PathsTo[LeafBaseCrown]) -> Iterable[tuple[KeyPath, Key]]:
+    # each branch is yielded once with key of its first child,
+    # keys of all children have the same kind because paths are already checked for consistency
     yielded_branch_path: set[KeyPath] = set()
     for path in paths_to_leaves:
-        for i in range(len(path) - 1, -2, -1):
+        for i in range(len(path) - 1, -1, -1):
             sub_path = path[:i]
             if sub_path in yielded_branch_path:
                 break
 
+            yielded_branch_path.add(sub_path)
             yield sub_path, path[i]
 
 
@@ -401,10 +475,10 @@ class BuiltinExtraMoveAndPoliciesMaker(ExtraMoveMaker, ExtraPoliciesMaker):
         mediator: Mediator,
         request: InputNameLayoutRequest,
     ) -> InpExtraMove:
-        schema = provide_schema(ExtraMoveAndPoliciesOverlay, mediator, request.loc_stack)
-        if schema.extra_in in (ExtraForbid(), ExtraSkip()):
+        schema = _provide_cached_schema(ExtraMoveAndPoliciesOverlay, mediator, request.loc_stack)
+        if schema.extra_in is ExtraForbid() or schema.extra_in is ExtraSkip():
             return None
-        if schema.extra_in == ExtraKwargs():
+        if schema.extra_in is ExtraKwargs():
             return ExtraKwargs()
         if callable(schema.extra_in):
             return ExtraSaturate(schema.extra_in)
@@ -415,17 +489,17 @@ class BuiltinExtraMoveAndPoliciesMaker(ExtraMoveMaker, ExtraPoliciesMaker):
         mediator: Mediator,
         request: OutputNameLayoutRequest,
     ) -> OutExtraMove:
-        schema = provide_schema(ExtraMoveAndPoliciesOverlay, mediator, request.loc_stack)
-        if schema.extra_out == ExtraSkip():
+        schema = _provide_cached_schema(ExtraMoveAndPoliciesOverlay, mediator, request.loc_stack)
+        if schema.extra_out is ExtraSkip():
             return None
         if callable(schema.extra_out):
             return ExtraExtract(schema.extra_out)
         return self._create_extra_targets(schema.extra_out)  # type: ignore[arg-type]
 
     def _get_extra_policy(self, schema: ExtraMoveAndPoliciesSchema) -> DictExtraPolicy:
-        if schema.extra_in == ExtraSkip():
+        if schema.extra_in is ExtraSkip():
             return ExtraSkip()
-        if schema.extra_in == ExtraForbid():
+        if schema.extra_in is ExtraForbid():
             return ExtraForbid()
         return ExtraCollect()
 
@@ -435,13 +509,13 @@ class BuiltinExtraMoveAndPoliciesMaker(ExtraMoveMaker, ExtraPoliciesMaker):
         request: InputNameLayoutRequest,
         paths_to_leaves: PathsTo[LeafInpCrown],
     ) -> PathsTo[DictExtraPolicy]:
-        schema = provide_schema(ExtraMoveAndPoliciesOverlay, mediator, request.loc_stack)
+        schema = _provide_cached_schema(ExtraMoveAndPoliciesOverlay, mediator, request.loc_stack)
         policy = self._get_extra_policy(schema)
         path_to_extra_policy: dict[KeyPath, DictExtraPolicy] = {
             (): policy,
         }
         for path, key in _paths_to_branches(paths_to_leaves):
-            if policy == ExtraCollect() and isinstance(key, int):
+            if policy is ExtraCollect() and isinstance(key, int):
                 raise CannotProvide(
                     "Can not use collecting extra_in with list mapping",
                     is_terminal=True,
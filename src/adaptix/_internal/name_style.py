@@ -1,7 +1,6 @@
-import re
 from dataclasses import dataclass
 from enum import Enum
-from functools import partial
+from functools import lru_cache
 from typing import Callable
 
 
@@ -63,35 +62,59 @@ STYLE_CONVERSIONS = {
     NameStyle.UPPER_DOT: StyleConversion(".", *UPPER_CASE),
 }
 
-ONLY_WORD_CHARS = re.compile(r"\w+")
-
 
 def is_snake_style(name: str) -> bool:
-    return ONLY_WORD_CHARS.fullmatch(name) is not None
+    # same as fullmatch of r"\w+" (that is alphanumeric or underscore chars), but much faster,
+    # ASCII-only pattern is not used because non-ASCII letters are valid in names
+    return name.replace("_", "a").isalnum()
 
 
-SNAKE_SPLITTER = re.compile(r"(_*)([^_]+)(.*?)(_*)$")
-REST_SUB = re.compile(r"(_+)|([^_]+)")
+def _make_converter(conv: StyleConversion) -> Callable[[str], str]:
+    sep = conv.sep
+    first = conv.first
+    other = conv.other
 
+    if first is other:
+        # underscore is an uncased char that separates words for all case functions,
+        # so the whole core can be converted at once and then underscores are replaced
+        # (str.translate table would be slower and would convert only ASCII letters)
+        def uniform_converter(name: str) -> str:
+            stripped_front = name.lstrip("_")
+            core = stripped_front.rstrip("_")
+            if not core:
+                raise ValueError(f"Cannot convert {name!r}")
 
-def rest_sub(conv: StyleConversion, match_: re.Match):
-    if match_[1] is None:
-        return conv.other(match_[2])
-    return match_[1].replace("_", conv.sep)
+            return (
+                name[:len(name) - len(stripped_front)]
+                + first(core).replace("_", sep)
+                + stripped_front[len(core):]
+            )
 
+        return uniform_converter
 
-def convert_snake_style(name: str, style: NameStyle) -> str:
-    if not is_snake_style(name):
-        raise ValueError("Cannot convert a name that not follows snake style")
+    def converter(name: str) -> str:
+        stripped_front = name.lstrip("_")
+        core = stripped_front.rstrip("_")
+        if not core:
+            raise ValueError(f"Cannot convert {name!r}")
+
+        raw_first, *raw_rest = core.split("_")
+        # each underscore inside the name is replaced by separator, so empty words are kept
+        return (
+            name[:len(name) - len(stripped_front)]
+            + sep.join([first(raw_first), *map(other, raw_rest)])
+            + stripped_front[len(core):]
+        )
 
-    match = SNAKE_SPLITTER.match(name)
-    if match is None:
-        raise ValueError(f"Cannot convert {name!r}")
+    return converter
 
-    front_us, raw_first, raw_rest, trailing_us = match.groups()
-    conv = STYLE_CONVERSIONS[style]
 
-    first = conv.first(raw_first)
-    rest = REST_SUB.sub(partial(rest_sub, conv), raw_rest)
+STYLE_CONVERTERS = {style: _make_converter(conv) for style, conv in STYLE_CONVERSIONS.items()}
+
+
+@lru_cache(maxsize=4096)
+def convert_snake_style(name: str, style: NameStyle) -> str:
+    if not is_snake_style(name):
+        raise ValueError("Cannot convert a name that not follows snake style")
 
-    return front_us + first + rest + trailing_us
+    return STYLE_CONVERTERS[style](name)
@@ -244,6 +244,8 @@ RequestHandler = Callable[[Mediator[ResponseT], RequestT], ResponseT]
 
 
 class RequestChecker(ABC, Generic[RequestT]):
+    __slots__ = ()
+
     @abstractmethod
     def check_request(self, mediator: DirectMediator, request: RequestT, /) -> bool:
         ...
@@ -251,6 +253,7 @@ class RequestChecker(ABC, Generic[RequestT]):
 
 class Provider(ABC):
     """An object that can process Request instances"""
+    __slots__ = ()
 
     @abstractmethod
     def get_request_handlers(self) -> Sequence[tuple[type[Request], RequestChecker, RequestHandler]]:
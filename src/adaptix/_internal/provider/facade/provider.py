@@ -18,6 +18,6 @@ def bound_by_any(preds: Sequence[Pred], provider: Provider) -> Provider:
 
 
 def bound(pred: Pred, provider: Provider) -> Provider:
-    if pred == Omitted():
+    if pred is Omitted():
         return provider
     return LocStackBoundingProvider(create_loc_stack_checker(pred), provider)
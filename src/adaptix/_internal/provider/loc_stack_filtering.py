@@ -1,14 +1,13 @@
 import inspect
-import operator
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Sequence
+from collections.abc import Container, Iterable, Sequence
 from copy import copy
-from dataclasses import dataclass, replace
-from functools import reduce
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from inspect import isabstract, isgenerator
-from re import Pattern
-from typing import Any, ClassVar, Optional, TypeVar, Union, final
+from re import Match, Pattern
+from typing import Any, Callable, ClassVar, Optional, TypeVar, Union, final
 
 from ..common import TypeHint, VarTuple
 from ..datastructures import ImmutableStack
@@ -24,7 +23,7 @@ from ..type_tools import (
 )
 from ..type_tools.normalize_type import NotSubscribedError
 from .essential import DirectMediator
-from .location import AnyLoc, FieldLoc, GenericParamLoc, TypeHintLoc
+from .location import AnyLoc, FieldLoc, GenericParamLoc, TypeHintLoc, get_castable_loc_types
 
 LocStackT = TypeVar("LocStackT", bound="LocStack")
 AnyLocT_co = TypeVar("AnyLocT_co", bound=AnyLoc, covariant=True)
@@ -36,20 +35,29 @@ class LocStack(ImmutableStack[AnyLocT_co]):
 
 
 class LocStackChecker(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def check_loc_stack(self, mediator: DirectMediator, loc_stack: LocStack) -> bool:
         ...
 
+    def _flatten(self, operator_cls: type["BinOperatorLSC"]) -> VarTuple["LocStackChecker"]:
+        return (self, )
+
     @final
     def __or__(self, other: Any) -> "LocStackChecker":
         if isinstance(other, LocStackChecker):
-            return OrLocStackChecker([self, other])
+            return OrLocStackChecker(
+                [*self._flatten(OrLocStackChecker), *other._flatten(OrLocStackChecker)],
+            )
         return NotImplemented
 
     @final
     def __and__(self, other: Any) -> "LocStackChecker":
         if isinstance(other, LocStackChecker):
-            return AndLocStackChecker([self, other])
+            return AndLocStackChecker(
+                [*self._flatten(AndLocStackChecker), *other._flatten(AndLocStackChecker)],
+            )
         return NotImplemented
 
     @final
@@ -60,10 +68,14 @@ class LocStackChecker(ABC):
 
     @final
     def __invert__(self) -> "LocStackChecker":
+        if isinstance(self, InvertLSC):
+            return self._lsc
         return InvertLSC(self)
 
 
 class InvertLSC(LocStackChecker):
+    __slots__ = ("_lsc", )
+
     def __init__(self, lsc: LocStackChecker):
         self._lsc = lsc
 
@@ -72,44 +84,98 @@ class InvertLSC(LocStackChecker):
 
 
 class BinOperatorLSC(LocStackChecker, ABC):
+    __slots__ = ("_loc_stack_checkers", )
+
     def __init__(self, loc_stack_checkers: Iterable[LocStackChecker]):
-        self._loc_stack_checkers = loc_stack_checkers
+        self._loc_stack_checkers = tuple(loc_stack_checkers)
 
-    @abstractmethod
-    def _reduce(self, elements: Iterable[bool], /) -> bool:
-        ...
+    def _flatten(self, operator_cls: type["BinOperatorLSC"]) -> VarTuple[LocStackChecker]:
+        if type(self) is operator_cls:
+            return self._loc_stack_checkers
+        return (self, )
+
+
+class ShortCircuitLSC(BinOperatorLSC, ABC):
+    """Operator that may stop before evaluating all operands.
+
+    Operands are reordered by estimated evaluation cost, so cheap checkers are able to cut off expensive ones.
+    Checkers are pure predicates, therefore, the result does not depend on the order.
+    Unknown checkers are placed at the end keeping their relative order.
+    """
+    __slots__ = ()
+
+    def __init__(self, loc_stack_checkers: Iterable[LocStackChecker]):
+        super().__init__(sorted(loc_stack_checkers, key=_get_lsc_cost))
+
+
+class OrLocStackChecker(ShortCircuitLSC):
+    __slots__ = ()
 
     def check_loc_stack(self, mediator: DirectMediator, loc_stack: LocStack) -> bool:
-        return self._reduce(
-            loc_stack_checker.check_loc_stack(mediator, loc_stack)
-            for loc_stack_checker in self._loc_stack_checkers
-        )
+        for loc_stack_checker in self._loc_stack_checkers:
+            if loc_stack_checker.check_loc_stack(mediator, loc_stack):
+                return True
+        return False
 
 
-class OrLocStackChecker(BinOperatorLSC):
-    _reduce = any  # type: ignore[assignment]
+class AndLocStackChecker(ShortCircuitLSC):
+    __slots__ = ("_castable_loc_types", "_checks")
 
+    def __init__(self, loc_stack_checkers: Iterable[LocStackChecker]):
+        super().__init__(loc_stack_checkers)
+        last_loc_checkers = [lsc for lsc in self._loc_stack_checkers if isinstance(lsc, LastLocChecker)]
+        # castability of the last location is checked once for all LastLocChecker operands
+        self._castable_loc_types = tuple(
+            get_castable_loc_types(expected_location)
+            for expected_location in dict.fromkeys(lsc._expected_location for lsc in last_loc_checkers)
+        )
+        # operands keep cost order, LastLocChecker operands examine the last location directly
+        self._checks: VarTuple[tuple[Callable[[DirectMediator, Any], bool], bool]] = tuple(
+            (lsc._check_location, True) if isinstance(lsc, LastLocChecker) else (lsc.check_loc_stack, False)
+            for lsc in self._loc_stack_checkers
+        )
 
-class AndLocStackChecker(BinOperatorLSC):
-    _reduce = all  # type: ignore[assignment]
+    def check_loc_stack(self, mediator: DirectMediator, loc_stack: LocStack) -> bool:
+        last_loc = None
+        if self._castable_loc_types:
+            last_loc = loc_stack.last
+            last_loc_type = type(last_loc)
+            for castable_loc_types in self._castable_loc_types:
+                if last_loc_type not in castable_loc_types:
+                    return False
+        for check, takes_last_loc in self._checks:  # noqa: SIM110  loop avoids generator creation
+            if not check(mediator, last_loc if takes_last_loc else loc_stack):
+                return False
+        return True
 
 
 class XorLocStackChecker(BinOperatorLSC):
-    def _reduce(self, elements: Iterable[bool], /) -> bool:
-        return reduce(operator.xor, elements)
+    __slots__ = ()
+
+    def check_loc_stack(self, mediator: DirectMediator, loc_stack: LocStack) -> bool:
+        result = False
+        for loc_stack_checker in self._loc_stack_checkers:
+            if loc_stack_checker.check_loc_stack(mediator, loc_stack):
+                result = not result
+        return result
 
 
 class LastLocChecker(LocStackChecker, ABC):
     _expected_location: ClassVar[type]
+    _castable_loc_types: ClassVar[Container[type]]
 
     def __init_subclass__(cls, **kwargs):
         param_list = list(inspect.signature(cls._check_location).parameters.values())
         cls._expected_location = param_list[2].annotation
+        # intermediate subclasses may leave the location unspecified until `_check_location` is implemented
+        if not getattr(cls._check_location, "__isabstractmethod__", False):
+            cls._castable_loc_types = get_castable_loc_types(cls._expected_location)
 
     @final
     def check_loc_stack(self, mediator: DirectMediator, loc_stack: LocStack) -> bool:
         last_loc = loc_stack.last
-        if last_loc.is_castable(self._expected_location):
+        # this is an inlined version of `last_loc.is_castable(self._expected_location)`
+        if type(last_loc) in self._castable_loc_types:
             return self._check_location(mediator, last_loc)
         return False
 
@@ -129,9 +195,36 @@ class ExactFieldNameLSC(LastLocChecker):
 @dataclass(frozen=True)
 class ReFieldNameLSC(LastLocChecker):
     pattern: Pattern[str]
+    _fullmatch: Callable[[str], Optional[Match[str]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_fullmatch", self.pattern.fullmatch)
 
     def _check_location(self, mediator: DirectMediator, loc: FieldLoc) -> bool:
-        return self.pattern.fullmatch(loc.field_id) is not None
+        return self._fullmatch(loc.field_id) is not None
+
+
+_LOC_NORM_KEY = "_loc_norm"
+_NOT_NORMALIZED = object()
+
+
+def normalize_loc_type(loc: AnyLoc) -> Optional[BaseNormType]:
+    """Normalize type of location, returns None if type can not be normalized.
+
+    Result is stored inside location, so several checkers examining the same location
+    share one normalization.
+    """
+    loc_dict = loc.__dict__
+    norm = loc_dict.get(_LOC_NORM_KEY, _NOT_NORMALIZED)
+    if norm is not _NOT_NORMALIZED:
+        return norm
+
+    try:
+        norm = normalize_type(loc.type)
+    except ValueError:
+        norm = None
+    loc_dict[_LOC_NORM_KEY] = norm
+    return norm
 
 
 @dataclass(frozen=True)
@@ -139,9 +232,8 @@ class ExactTypeLSC(LastLocChecker):
     norm: BaseNormType
 
     def _check_location(self, mediator: DirectMediator, loc: TypeHintLoc) -> bool:
-        try:
-            norm = normalize_type(loc.type)
-        except ValueError:
+        norm = normalize_loc_type(loc)
+        if norm is None:
             return False
         return norm == self.norm
 
@@ -151,9 +243,8 @@ class OriginSubclassLSC(LastLocChecker):
     type_: type
 
     def _check_location(self, mediator: DirectMediator, loc: TypeHintLoc) -> bool:
-        try:
-            norm = normalize_type(loc.type)
-        except ValueError:
+        norm = normalize_loc_type(loc)
+        if norm is None:
             return False
         return is_subclass_soft(norm.origin, self.type_)
 
@@ -163,9 +254,8 @@ class ExactOriginLSC(LastLocChecker):
     origin: Any
 
     def _check_location(self, mediator: DirectMediator, loc: TypeHintLoc) -> bool:
-        try:
-            norm = normalize_type(loc.type)
-        except ValueError:
+        norm = normalize_loc_type(loc)
+        if norm is None:
             return False
         return norm.origin == self.origin
 
@@ -181,13 +271,19 @@ class GenericParamLSC(LastLocChecker):
 @dataclass(frozen=True)
 class LocStackEndChecker(LocStackChecker):
     loc_stack_checkers: Sequence[LocStackChecker]
+    _reversed_checkers: VarTuple[LocStackChecker] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_reversed_checkers", tuple(reversed(self.loc_stack_checkers)))
 
     def check_loc_stack(self, mediator: DirectMediator, loc_stack: LocStack) -> bool:
-        if len(loc_stack) < len(self.loc_stack_checkers):
+        if len(loc_stack) < len(self._reversed_checkers):
             return False
 
-        for i, checker in enumerate(reversed(self.loc_stack_checkers), start=0):
-            if not checker.check_loc_stack(mediator, loc_stack.reversed_slice(i)):
+        for end_offset, checker in enumerate(self._reversed_checkers):
+            # the last checker gets the whole stack, so there is no need to copy it
+            sub_stack = loc_stack.reversed_slice(end_offset) if end_offset else loc_stack
+            if not checker.check_loc_stack(mediator, sub_stack):
                 return False
         return True
 
@@ -201,21 +297,47 @@ class LocStackSizeChecker(LocStackChecker):
 
 
 class AnyLocStackChecker(LocStackChecker):
+    __slots__ = ()
+
     def check_loc_stack(self, mediator: DirectMediator, loc_stack: LocStack) -> bool:
         return True
 
 
+_LSC_COST: dict[type[LocStackChecker], int] = {
+    AnyLocStackChecker: 0,
+    ExactFieldNameLSC: 1,
+    GenericParamLSC: 1,
+    LocStackSizeChecker: 1,
+    ExactOriginLSC: 2,
+    ExactTypeLSC: 3,
+    OriginSubclassLSC: 3,
+    ReFieldNameLSC: 4,
+    LocStackEndChecker: 5,
+}
+_MAX_LSC_COST = 10
+
+
+def _get_lsc_cost(loc_stack_checker: LocStackChecker) -> int:
+    return _LSC_COST.get(type(loc_stack_checker), _MAX_LSC_COST)
+
+
 Pred = Union[str, re.Pattern, type, TypeHint, LocStackChecker, "LocStackPattern"]
 
 
+# compiled patterns are immutable, so they can be shared between checkers
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    return re.compile(pattern)
+
+
 def _create_non_type_hint_loc_stack_checker(pred: Pred) -> Optional[LocStackChecker]:
+    if isinstance(pred, re.Pattern):
+        return ReFieldNameLSC(pred)
+
     if isinstance(pred, str):
         if pred.isidentifier():
             return ExactFieldNameLSC(pred)  # this is only an optimization
-        return ReFieldNameLSC(re.compile(pred))
-
-    if isinstance(pred, re.Pattern):
-        return ReFieldNameLSC(pred)
+        return ReFieldNameLSC(_compile_pattern(pred))
 
     if isinstance(pred, LocStackChecker):
         return pred
@@ -28,13 +28,15 @@ class LocatedRequest(Request[T]):
 
 
 class LocatedRequestChecker(RequestChecker[LocatedRequest]):
-    __slots__ = ("loc_stack_checker", )
+    __slots__ = ("_check_loc_stack", "loc_stack_checker")
 
     def __init__(self, loc_stack_checker: LocStackChecker):
         self.loc_stack_checker = loc_stack_checker
+        # method is bound once because checker is called for almost every request
+        self._check_loc_stack = loc_stack_checker.check_loc_stack
 
     def check_request(self, mediator: DirectMediator, request: LocatedRequest, /) -> bool:
-        return self.loc_stack_checker.check_loc_stack(mediator, request.loc_stack)
+        return self._check_loc_stack(mediator, request.loc_stack)
 
 
 class LocatedRequestMethodsProvider(MethodsProvider):
@@ -63,6 +65,8 @@ def for_predicate(pred: Pred):
 
 
 class LocStackBoundingProvider(Provider):
+    __slots__ = ("_loc_stack_checker", "_provider")
+
     def __init__(self, loc_stack_checker: LocStackChecker, provider: Provider):
         self._loc_stack_checker = loc_stack_checker
         self._provider = provider
@@ -97,4 +97,10 @@ _CAST_SOURCES: dict[Any, Container[Any]] = {
     GenericParamLoc: {GenericParamLoc},
 }
 
+
+def get_castable_loc_types(tp: type) -> Container[type]:
+    """Returns types of locations that can be cast to the given location type"""
+    return _CAST_SOURCES[tp]
+
+
 AnyLoc = Union[TypeHintLoc, FieldLoc, InputFieldLoc, InputFuncFieldLoc, OutputFieldLoc, GenericParamLoc]
@@ -9,6 +9,8 @@ T = TypeVar("T")
 
 
 class ConcatProvider(Provider):
+    __slots__ = ("_providers", )
+
     def __init__(self, *providers: Provider):
         self._providers = providers
 
@@ -33,26 +35,32 @@ RequestT = TypeVar("RequestT", bound=Request)
 ResponseT = TypeVar("ResponseT")
 
 
+def _make_chain(first, second):
+    # closure is used instead of callable object because it is called much faster
+    def chain_processor(data):
+        return second(first(data))
+
+    return chain_processor
+
+
 class ChainingProvider(Provider):
+    __slots__ = ("_chain", "_provider")
+
     def __init__(self, chain: Chain, provider: Provider):
         self._chain = chain
         self._provider = provider
 
-    def _make_chain(self, first, second):
-        def chain_processor(data):
-            return second(first(data))
-
-        return chain_processor
-
     def _wrap_handler(self, handler: RequestHandler[ResponseT, RequestT]) -> RequestHandler[ResponseT, RequestT]:
-        def chaining_handler(mediator: Mediator[ResponseT], request: RequestT) -> ResponseT:
-            current_processor = handler(mediator, request)
-            next_processor = mediator.provide_from_next()
-
-            if self._chain == Chain.FIRST:
-                return self._make_chain(current_processor, next_processor)
-            if self._chain == Chain.LAST:
-                return self._make_chain(next_processor, current_processor)
+        # chain order is resolved once here instead of at each handler call
+        if self._chain is Chain.FIRST:
+            def chaining_handler(mediator: Mediator[ResponseT], request: RequestT) -> ResponseT:
+                current_processor = handler(mediator, request)
+                return _make_chain(current_processor, mediator.provide_from_next())
+        elif self._chain is Chain.LAST:
+            def chaining_handler(mediator: Mediator[ResponseT], request: RequestT) -> ResponseT:
+                current_processor = handler(mediator, request)
+                return _make_chain(mediator.provide_from_next(), current_processor)
+        else:
             raise ValueError
 
         return chaining_handler
@@ -58,11 +58,13 @@ class BaseRetort(Cloneable, metaclass=RetortMeta):
 
     def _calculate_derived(self) -> None:
         super()._calculate_derived()
+        self._recipe_head = tuple(self._get_recipe_head())
+        self._recipe_tail = tuple(self._get_recipe_tail())
         self._full_recipe = tuple(
             itertools.chain(
-                self._get_recipe_head(),
+                self._recipe_head,
                 self._instance_recipe,
                 self._full_class_recipe,
-                self._get_recipe_tail(),
+                self._recipe_tail,
             ),
         )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Any, Callable, Generic, Optional, TypeVar
 
 from ..provider.essential import (
@@ -69,20 +69,22 @@ class BasicRequestBus(RequestBus[RequestT, ResponseT], Generic[RequestT, Respons
         return self._send_inner(request, search_offset)
 
     def _send_inner(self, request: RequestT, search_offset: int) -> Any:
-        exceptions: list[CannotProvide] = []
+        # list is created only at first failure, successful search at first attempt is the most common case
+        exceptions: Optional[list[CannotProvide]] = None
         next_offset = search_offset
         mediator = self._mediator_factory(request, next_offset)
         while True:
             try:
                 handler, next_offset = self._router.route_handler(mediator, request, next_offset)
             except StopIteration:
+                sub_exceptions: Sequence[CannotProvide] = () if exceptions is None else exceptions
                 exc = AggregateCannotProvide.make(
                     self._error_representor.get_provider_not_found_description(request),
-                    exceptions,
+                    sub_exceptions,
                     is_demonstrative=True,
                 )
                 self._attach_request_context_notes(exc, request)
-                self._attach_sub_exceptions_notes(exc, exceptions)
+                self._attach_sub_exceptions_notes(exc, sub_exceptions)
                 raise exc from None
             except CannotProvide:
                 raise RuntimeError("RequestChecker raises CannotProvide")
@@ -93,7 +95,10 @@ class BasicRequestBus(RequestBus[RequestT, ResponseT], Generic[RequestT, Respons
             except CannotProvide as e:
                 if e.is_terminal:
                     raise self._attach_request_context_notes(e, request)
-                exceptions.append(e)
+                if exceptions is None:
+                    exceptions = [e]
+                else:
+                    exceptions.append(e)
                 continue
 
             return response
@@ -4,9 +4,8 @@ from typing import Optional, TypeVar, Union
 
 from ..common import TypeHint
 from ..provider.essential import DirectMediator, Request, RequestChecker, RequestHandler
-from ..provider.loc_stack_filtering import ExactOriginLSC
+from ..provider.loc_stack_filtering import ExactOriginLSC, normalize_loc_type
 from ..provider.located_request import LocatedRequest, LocatedRequestChecker
-from ..type_tools import normalize_type
 from .request_bus import RequestRouter
 
 RequestT = TypeVar("RequestT", bound=Request)
@@ -53,10 +52,8 @@ class LocatedRequestRouter(RequestRouter[LocatedRequest]):
         request: LocatedRequest,
         search_offset: int,
     ) -> tuple[RequestHandler, int]:
-        try:
-            origin = normalize_type(request.last_loc.type).origin
-        except ValueError:
-            origin = object()
+        norm = normalize_loc_type(request.last_loc)
+        origin = object() if norm is None else norm.origin
 
         for i, routing_item in enumerate(
             islice(self._items, search_offset, None),
@@ -1,8 +1,10 @@
+import itertools
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, ClassVar, Optional, TypeVar
 
+from ..common import VarTuple
 from ..compat import CompatBaseExceptionGroup
 from ..provider.essential import (
     AggregateCannotProvide,
@@ -36,6 +38,7 @@ RequestT = TypeVar("RequestT", bound=Request)
 
 class SearchingRetort(BaseRetort, Provider, ABC):
     """A retort that can operate as Retort but have no predefined providers and no high-level user interface"""
+    _class_recipe_request_handlers: ClassVar[VarTuple[tuple[type[Request], RequestChecker, RequestHandler]]]
 
     def __init__(self, *, recipe: Iterable[Provider] = (), hide_traceback: bool = True):
         self._hide_traceback = hide_traceback
@@ -50,8 +53,7 @@ class SearchingRetort(BaseRetort, Provider, ABC):
 
         request_classes = {
             request_cls
-            for provider in self._get_full_recipe()
-            for request_cls, checker, handler in provider.get_request_handlers()
+            for request_cls, checker, handler in self._collect_request_handlers()
         }
         return [
             (request_class, AlwaysTrueRequestChecker(), retort_request_handler)
@@ -105,18 +107,44 @@ class SearchingRetort(BaseRetort, Provider, ABC):
 
     def _calculate_derived(self) -> None:
         super()._calculate_derived()
-        self._request_cls_to_router = self._create_request_cls_to_router(self._full_recipe)
+        self._request_cls_to_router = self._create_request_cls_to_router(self._collect_request_handlers())
         self._request_cls_to_error_representor = {
             request_cls: self._create_error_representor(request_cls)
             for request_cls in self._request_cls_to_router
         }
         self._call_cache: dict[Any, Any] = {}
 
-    def _create_request_cls_to_router(self, full_recipe: Sequence[Provider]) -> Mapping[type[Request], RequestRouter]:
+    @classmethod
+    def _get_class_recipe_request_handlers(cls) -> VarTuple[tuple[type[Request], RequestChecker, RequestHandler]]:
+        # class recipe is shared by all instances of the class,
+        # so its request handlers are collected only once instead of at each instance creation or clone
+        try:
+            return cls.__dict__["_class_recipe_request_handlers"]
+        except KeyError:
+            pass
+
+        request_handlers = tuple(
+            request_handler
+            for provider in cls._full_class_recipe
+            for request_handler in provider.get_request_handlers()
+        )
+        cls._class_recipe_request_handlers = request_handlers
+        return request_handlers
+
+    def _collect_request_handlers(self) -> Iterable[tuple[type[Request], RequestChecker, RequestHandler]]:
+        for provider in itertools.chain(self._recipe_head, self._instance_recipe):
+            yield from provider.get_request_handlers()
+        yield from self._get_class_recipe_request_handlers()
+        for provider in self._recipe_tail:
+            yield from provider.get_request_handlers()
+
+    def _create_request_cls_to_router(
+        self,
+        request_handlers: Iterable[tuple[type[Request], RequestChecker, RequestHandler]],
+    ) -> Mapping[type[Request], RequestRouter]:
         request_cls_to_checkers_and_handlers: defaultdict[type[Request], list[CheckerAndHandler]] = defaultdict(list)
-        for provider in full_recipe:
-            for request_cls, checker, handler in provider.get_request_handlers():
-                request_cls_to_checkers_and_handlers[request_cls].append((checker, handler))
+        for request_cls, checker, handler in request_handlers:
+            request_cls_to_checkers_and_handlers[request_cls].append((checker, handler))
 
         return {
             request_cls: self._create_router(request_cls, checkers_and_handlers)
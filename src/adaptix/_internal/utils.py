@@ -148,14 +148,16 @@ def get_prefix_groups(
     except StopIteration:
         return []
 
+    prefix_len = len(prefix)
     for value in sorted_values:
-        if value[:len(prefix)] == prefix:
+        if value[:prefix_len] == prefix:
             current_group.append(value)
         else:
             if current_group:
                 groups.append((prefix, current_group))
                 current_group = []
             prefix = value
+            prefix_len = len(prefix)
 
     if current_group:
         groups.append((prefix, current_group))
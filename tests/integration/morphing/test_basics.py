@@ -1,10 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import pytest
 from tests_helpers import raises_exc, with_trail
 
-from adaptix import DebugTrail, Retort
+from adaptix import DebugTrail, Retort, name_mapping
 from adaptix.load_error import AggregateLoadError, TypeLoadError
 from adaptix.struct_trail import get_trail
 
@@ -92,3 +92,22 @@ def test_int_dt_disable(accum):
 
     dumper = retort.get_dumper(ExampleInt)
     assert dumper(ExampleInt(field1=1, field2=1)) == {"field1": 1, "field2": 1}
+
+
+@dataclass
+class ExampleConstantFactories:
+    field1: Any = field(default_factory=int)
+    field2: Any = field(default_factory=frozenset)
+    field3: Any = field(default_factory=list)
+
+
+def test_omit_default_constant_factories(accum):
+    retort = Retort(recipe=[accum, name_mapping(omit_default=True)])
+
+    dumper = retort.get_dumper(ExampleConstantFactories)
+    assert dumper(ExampleConstantFactories()) == {}
+    assert dumper(ExampleConstantFactories(1, frozenset([2]), [3])) == {
+        "field1": 1,
+        "field2": frozenset([2]),
+        "field3": [3],
+    }
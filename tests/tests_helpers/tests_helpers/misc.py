@@ -87,6 +87,7 @@ def raises_exc(
     with pytest.raises(exc_type, match=match) as exc_info:
         func()
 
+    # whole structure is compared (fields, trail, cause and notes), so tests pin the exact error
     assert _repr_value(exc_info.value) == _repr_value(exc)
 
     return exc_info.value
@@ -0,0 +1,59 @@
+import linecache
+from concurrent.futures import ThreadPoolExecutor
+
+from adaptix._internal.code_tools.code_builder import CodeBuilder
+from adaptix._internal.code_tools.compiler import BasicClosureCompiler, ConcurrentCounter
+
+
+def test_concurrent_counter():
+    counter = ConcurrentCounter()
+    assert [counter.generate_idx("a") for _ in range(3)] == [0, 1, 2]
+    assert counter.generate_idx("b") == 0
+    assert counter.generate_idx("a") == 3
+
+
+def test_concurrent_counter_threads():
+    counter = ConcurrentCounter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        indexes = list(executor.map(lambda _: counter.generate_idx("a"), range(1000)))
+    assert sorted(indexes) == list(range(1000))
+
+
+def test_compiled_closures_keep_own_filename():
+    builder = CodeBuilder()
+    builder += "def closure(data):"
+    with builder:
+        builder += "return data"
+    builder += "return closure"
+
+    filenames = []
+
+    def filename_maker(unique_id):
+        filenames.append(f"<{unique_id}>")
+        return filenames[-1]
+
+    compiler = BasicClosureCompiler()
+    first = compiler.compile("test_closure", filename_maker, builder, {})
+    second = compiler.compile("test_closure", filename_maker, builder, {})
+
+    assert first is not second
+    assert [first.__code__.co_filename, second.__code__.co_filename] == filenames
+    assert len(set(filenames)) == 2
+
+
+def test_compiled_source_is_available_at_linecache():
+    builder = CodeBuilder()
+    builder += "def closure(data):"
+    with builder:
+        builder += "return data"
+    builder += "return closure"
+
+    closure = BasicClosureCompiler().compile("test_linecache", lambda unique_id: f"<{unique_id}>", builder, {})
+    filename = closure.__code__.co_filename
+    assert list(linecache.getlines(filename)) == [
+        "def _closure_maker():\n",
+        "    def closure(data):\n",
+        "        return data\n",
+        "    return closure",
+    ]
+    assert linecache.getline(filename, 3) == "        return data\n"
@@ -249,6 +249,43 @@ def test_param_name_duplicates():
         )
 
 
+def test_param_name_duplicates_reports_only_duplicated():
+    with pytest.raises(ValueError, match=full_match("Parameter names {'a'} are duplicated")):
+        InputShape(
+            constructor=stub_constructor,
+            kwargs=None,
+            fields=tuple(
+                InputField(
+                    id=field_id,
+                    type=int,
+                    default=NoDefault(),
+                    is_required=True,
+                    metadata={},
+                    original=None,
+                )
+                for field_id in ["a1", "a2", "b"]
+            ),
+            params=(
+                Param(
+                    field_id="a1",
+                    name="a",
+                    kind=ParamKind.POS_OR_KW,
+                ),
+                Param(
+                    field_id="a2",
+                    name="a",
+                    kind=ParamKind.POS_OR_KW,
+                ),
+                Param(
+                    field_id="b",
+                    name="b",
+                    kind=ParamKind.POS_OR_KW,
+                ),
+            ),
+            overriden_types=frozenset(),
+        )
+
+
 def test_optional_and_positional_only():
     with pytest.raises(ValueError, match=full_match("Field 'a' can not be positional only and optional")):
         InputShape(
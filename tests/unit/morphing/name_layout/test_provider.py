@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from types import FunctionType
 from typing import Any, Dict, Optional, Union
 
@@ -566,6 +567,57 @@ def test_gaps_filling():
     )
 
 
+class IntKey(IntEnum):
+    A = 0
+    B = 2
+
+
+def test_int_subclass_key_is_list_index():
+    assert make_layouts(
+        TestField("a"),
+        TestField("b"),
+        name_mapping(
+            map={
+                "a": ("x", IntKey.A),
+                "b": ("x", IntKey.B),
+            },
+        ),
+        DEFAULT_NAME_MAPPING,
+    ) == Layouts(
+        inp=InputNameLayout(
+            crown=InpDictCrown(
+                map={
+                    "x": InpListCrown(
+                        map=(
+                            InpFieldCrown(id="a"),
+                            InpNoneCrown(),
+                            InpFieldCrown(id="b"),
+                        ),
+                        extra_policy=ExtraSkip(),
+                    ),
+                },
+                extra_policy=ExtraSkip(),
+            ),
+            extra_move=None,
+        ),
+        out=OutputNameLayout(
+            crown=OutDictCrown(
+                map={
+                    "x": OutListCrown(
+                        map=(
+                            OutFieldCrown(id="a"),
+                            OutNoneCrown(placeholder=DefaultValue(value=None)),
+                            OutFieldCrown(id="b"),
+                        ),
+                    ),
+                },
+                sieves={},
+            ),
+            extra_move=None,
+        ),
+    )
+
+
 def test_structure_flattening():
     assert make_layouts(
         TestField("a"),
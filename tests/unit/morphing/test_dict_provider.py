@@ -1,5 +1,6 @@
 import collections.abc
 from collections import defaultdict
+from functools import cache
 from typing import DefaultDict, Dict, List
 
 import pytest
@@ -18,7 +19,7 @@ def string_dumper(data):
     raise TypeError
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def retort():
     return Retort(
         recipe=[
@@ -27,19 +28,26 @@ def retort():
     )
 
 
+@pytest.fixture(scope="module")
+def configured_retort(retort):
+    # retort is immutable, so one replaced instance (with its generated loaders and dumpers)
+    # is shared by all tests of the module having the same settings
+    @cache
+    def configure(**kwargs):
+        return retort.replace(**kwargs)
+
+    return configure
+
+
 class MyMapping:
     def __init__(self, dct):
         self.dct = dct
+        self.keys = dct.keys
+        self.items = dct.items
 
-    def __getattr__(self, item):
-        return getattr(self.dct, item)
 
-
-def test_loading(retort, strict_coercion, debug_trail):
-    loader_ = retort.replace(
-        strict_coercion=strict_coercion,
-        debug_trail=debug_trail,
-    ).get_loader(
+def test_loading(configured_retort, strict_coercion, debug_trail):
+    loader_ = configured_retort(strict_coercion=strict_coercion, debug_trail=debug_trail).get_loader(
         Dict[str, str],
     )
 
@@ -98,11 +106,8 @@ def bad_string_loader(data):
     raise TypeError  # must raise LoadError instance (TypeLoadError)
 
 
-def test_loader_unexpected_error(retort, strict_coercion, debug_trail):
-    loader_ = retort.replace(
-        strict_coercion=strict_coercion,
-        debug_trail=debug_trail,
-    ).extend(
+def test_loader_unexpected_error(configured_retort, strict_coercion, debug_trail):
+    loader_ = configured_retort(strict_coercion=strict_coercion, debug_trail=debug_trail).extend(
         recipe=[
             loader(str, bad_string_loader),
         ],
@@ -145,10 +150,8 @@ def test_loader_unexpected_error(retort, strict_coercion, debug_trail):
         )
 
 
-def test_dumping(retort, debug_trail):
-    dumper_ = retort.replace(
-        debug_trail=debug_trail,
-    ).get_dumper(
+def test_dumping(configured_retort, debug_trail):
+    dumper_ = configured_retort(debug_trail=debug_trail).get_dumper(
         Dict[str, str],
     )
 
@@ -180,23 +183,28 @@ def test_dumping(retort, debug_trail):
         )
 
 
-def test_defaultdict_loading(retort, strict_coercion, debug_trail):
-    loader_ = retort.replace(
-        strict_coercion=strict_coercion,
-        debug_trail=debug_trail,
-    ).get_loader(
+def test_as_is_dumping(configured_retort, debug_trail):
+    dumper_ = configured_retort(debug_trail=debug_trail).get_dumper(
+        Dict[int, int],
+    )
+
+    data = {1: 2, 3: 4}
+    assert dumper_(data) == {1: 2, 3: 4}
+    assert dumper_(data) is not data
+    assert dumper_(MyMapping({1: 2})) == {1: 2}
+
+
+def test_defaultdict_loading(configured_retort, strict_coercion, debug_trail):
+    loader_ = configured_retort(strict_coercion=strict_coercion, debug_trail=debug_trail).get_loader(
         DefaultDict[str, str],
     )
 
     assert loader_({"a": "b", "c": "d"}) == defaultdict(None, {"a": "b", "c": "d"})
 
 
-def test_defaultdict_loader(retort, strict_coercion, debug_trail):
+def test_defaultdict_loader(configured_retort, strict_coercion, debug_trail):
     default_factory = list
-    loader_ = retort.replace(
-        strict_coercion=strict_coercion,
-        debug_trail=debug_trail,
-    ).extend(
+    loader_ = configured_retort(strict_coercion=strict_coercion, debug_trail=debug_trail).extend(
         recipe=[
             default_dict(defaultdict, default_factory=default_factory),
         ],
@@ -206,10 +214,8 @@ def test_defaultdict_loader(retort, strict_coercion, debug_trail):
     assert loader_({"a": ["b", "c"]}).default_factory == default_factory
 
 
-def test_defaultdict_dumping(retort, debug_trail):
-    dumper_ = retort.replace(
-        debug_trail=debug_trail,
-    ).get_dumper(
+def test_defaultdict_dumping(configured_retort, debug_trail):
+    dumper_ = configured_retort(debug_trail=debug_trail).get_dumper(
         DefaultDict[str, str],
     )
 
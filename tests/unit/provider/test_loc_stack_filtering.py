@@ -1,5 +1,7 @@
 # ruff: noqa: A001, A002
 import collections.abc
+import re
+from abc import ABC, abstractmethod
 from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Annotated, Any, Dict, Generic, Iterable, List, Optional, Type, TypeVar, Union, overload
@@ -11,13 +13,23 @@ from tests_helpers.misc import create_mediator
 from adaptix import Chain, P, Retort, loader
 from adaptix._internal.common import TypeHint
 from adaptix._internal.model_tools.definitions import NoDefault
+from adaptix._internal.provider.essential import DirectMediator
 from adaptix._internal.provider.loc_stack_filtering import (
+    AndLocStackChecker,
+    ExactFieldNameLSC,
     ExactOriginLSC,
     ExactTypeLSC,
+    LastLocChecker,
     LocStack,
+    LocStackChecker,
     LocStackEndChecker,
+    LocStackSizeChecker,
     OriginSubclassLSC,
+    OrLocStackChecker,
+    ReFieldNameLSC,
+    XorLocStackChecker,
     create_loc_stack_checker,
+    normalize_loc_type,
 )
 from adaptix._internal.provider.location import FieldLoc, GenericParamLoc, TypeHintLoc
 from adaptix._internal.type_tools import normalize_type
@@ -379,3 +391,136 @@ class MyGeneric(Generic[T]):
 def test_create_request_checker(value, result, context):
     with context or nullcontext():
         assert create_loc_stack_checker(value) == result
+
+
+class CallCountingLSC(LocStackChecker):
+    def __init__(self, *, result: bool):
+        self.result = result
+        self.calls = 0
+
+    def check_loc_stack(self, mediator: DirectMediator, loc_stack: LocStack) -> bool:
+        self.calls += 1
+        return self.result
+
+
+def test_and_evaluates_cheap_checkers_first():
+    expensive = CallCountingLSC(result=True)
+    checker = AndLocStackChecker([expensive, ExactFieldNameLSC("user_id")])
+
+    loc_stack = LocStack(TypeHintLoc(WithUserName), field_loc_map("user_name", str))
+    assert checker.check_loc_stack(create_mediator(), loc_stack) is False
+    assert expensive.calls == 0
+
+    loc_stack = LocStack(TypeHintLoc(WithUserName), field_loc_map("user_id", str))
+    assert checker.check_loc_stack(create_mediator(), loc_stack) is True
+    assert expensive.calls == 1
+
+
+class CallCountingPattern:
+    def __init__(self, pattern: str):
+        self.pattern = re.compile(pattern)
+        self.calls = 0
+
+    def fullmatch(self, string: str):
+        self.calls += 1
+        return self.pattern.fullmatch(string)
+
+
+def test_and_evaluates_cheap_checkers_before_last_location_checkers():
+    pattern = CallCountingPattern("user_.*")
+    checker = AndLocStackChecker([ReFieldNameLSC(pattern), LocStackSizeChecker(1)])  # type: ignore[arg-type]
+
+    loc_stack = LocStack(TypeHintLoc(WithUserName), field_loc_map("user_name", str))
+    assert checker.check_loc_stack(create_mediator(), loc_stack) is False
+    assert pattern.calls == 0
+
+
+def test_or_evaluates_cheap_checkers_first():
+    expensive = CallCountingLSC(result=False)
+    checker = OrLocStackChecker([expensive, ExactFieldNameLSC("user_name")])
+
+    loc_stack = LocStack(TypeHintLoc(WithUserName), field_loc_map("user_name", str))
+    assert checker.check_loc_stack(create_mediator(), loc_stack) is True
+    assert expensive.calls == 0
+
+    loc_stack = LocStack(TypeHintLoc(WithUserName), field_loc_map("user_id", str))
+    assert checker.check_loc_stack(create_mediator(), loc_stack) is False
+    assert expensive.calls == 1
+
+
+def test_operators_flatten_nested_checkers():
+    first, second, third = ExactFieldNameLSC("a"), ExactFieldNameLSC("b"), ExactFieldNameLSC("c")
+
+    or_checker = first | second | third
+    assert isinstance(or_checker, OrLocStackChecker)
+    assert or_checker._loc_stack_checkers == (first, second, third)
+
+    and_checker = first & (second & third)
+    assert isinstance(and_checker, AndLocStackChecker)
+    assert and_checker._loc_stack_checkers == (first, second, third)
+
+    assert ~~first is first
+
+
+@pytest.mark.parametrize(
+    ["loc_stack", "result"],
+    [
+        pytest.param(LocStack(TypeHintLoc(WithUserName), field_loc_map("user_name", str)), True, id="ok"),
+        pytest.param(LocStack(TypeHintLoc(WithUserName), field_loc_map("user_name", int)), False, id="bad-type"),
+        pytest.param(LocStack(TypeHintLoc(WithUserName), field_loc_map("user_id", str)), False, id="bad-name"),
+        pytest.param(LocStack(TypeHintLoc(str)), False, id="not-a-field"),
+    ],
+)
+def test_and_checks_last_location(loc_stack, result):
+    checker = create_loc_stack_checker("user_name") & create_loc_stack_checker(str) & P.ANY
+    assert checker.check_loc_stack(create_mediator(), loc_stack) == result
+
+
+def test_normalize_loc_type_is_cached():
+    loc = TypeHintLoc(List[int])
+    assert normalize_loc_type(loc) == normalize_type(List[int])
+    assert normalize_loc_type(loc) is normalize_loc_type(loc)
+    assert loc == TypeHintLoc(List[int])
+    assert hash(loc) == hash(TypeHintLoc(List[int]))
+
+    assert normalize_loc_type(TypeHintLoc(100)) is None
+
+
+@pytest.mark.parametrize(
+    ["operands", "result"],
+    [
+        pytest.param([True, False], True, id="one"),
+        pytest.param([True, True], False, id="two"),
+        pytest.param([True, True, True], True, id="three"),
+        pytest.param([False, False, False], False, id="none"),
+    ],
+)
+def test_xor(operands, result):
+    checker = XorLocStackChecker([CallCountingLSC(result=operand) for operand in operands])
+    assert checker.check_loc_stack(create_mediator(), LocStack(TypeHintLoc(int))) == result
+
+
+class IntermediateLSC(LastLocChecker, ABC):
+    pass
+
+
+class AbstractAnyLocLSC(IntermediateLSC, ABC):
+    @abstractmethod
+    def _check_location(self, mediator: DirectMediator, loc: Any) -> bool:
+        ...
+
+
+class FieldIdPrefixLSC(AbstractAnyLocLSC):
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def _check_location(self, mediator: DirectMediator, loc: FieldLoc) -> bool:
+        return loc.field_id.startswith(self.prefix)
+
+
+def test_intermediate_last_loc_checker_subclasses():
+    checker = FieldIdPrefixLSC("user_")
+    mediator = create_mediator()
+    assert checker.check_loc_stack(mediator, LocStack(TypeHintLoc(WithUserName), field_loc_map("user_id", str)))
+    assert not checker.check_loc_stack(mediator, LocStack(TypeHintLoc(WithUserName), field_loc_map("id", str)))
+    assert not checker.check_loc_stack(mediator, LocStack(TypeHintLoc(str)))
@@ -4,7 +4,7 @@ from typing import List
 import pytest
 from tests_helpers import raises_exc, with_cause, with_notes
 
-from adaptix import AggregateCannotProvide, CannotProvide, ProviderNotFoundError, Retort
+from adaptix import AggregateCannotProvide, CannotProvide, ProviderNotFoundError, Retort, loader
 from adaptix.conversion import get_converter
 
 
@@ -329,3 +329,16 @@ def test_cannot_produce_converter_no_coercer_complex_type(list_tp, list_tp_name)
         ),
         lambda: get_converter(Book, BookDTO),
     )
+
+
+def test_class_recipe_request_handlers_are_shared():
+    class ChildRetort(Retort):
+        recipe = [
+            loader(int, lambda data: data * 2),
+        ]
+
+    request_handlers = ChildRetort._get_class_recipe_request_handlers()
+    assert ChildRetort().get_loader(int)(1) == 2
+    assert ChildRetort().replace()._get_class_recipe_request_handlers() is request_handlers
+    assert Retort._get_class_recipe_request_handlers() is not request_handlers
+    assert ChildRetort(recipe=[loader(int, lambda data: data * 3)]).get_loader(int)(1) == 3